@@ -16,48 +16,85 @@ Usage:
 """
 
 import json
+import sys
 import time
 
-# ── Soft imports ──────────────────────────────────────────────────────────────
+# Known CircuitPython quirk: json.loads() runs ~3.6x slower until
+# json.dumps() has been called once.  Upstream tracker:
+#   https://github.com/adafruit/circuitpython/issues?q=json.loads+slow+json.dumps
+# (issue number not yet pinned here).  To check it still applies, time a
+# json.loads() in a fresh REPL, call json.dumps(None), and time it again.
+# Priming it here speeds up response parsing in adafruit_requests and any
+# json.loads() in user code.  Harmless on CPython — don't remove.
+try:
+    json.dumps(None)
+except Exception:
+    pass
 
-def _try_import(name):
-    try:
-        return __import__(name)
-    except (ImportError, NotImplementedError):
-        return None
+# ── Soft imports ──────────────────────────────────────────────────────────────
 
-board       = _try_import("board")
-busio       = _try_import("busio")
-analogio    = _try_import("analogio")
-microcontroller = _try_import("microcontroller")
-storage     = _try_import("storage")
-wifi        = _try_import("wifi")    # Pico W / ESP32-S2/S3 only
-socketpool  = _try_import("socketpool")
-adafruit_requests = _try_import("adafruit_requests")
+# Resolved once at import; sys.modules is checked first so already-loaded
+# modules cost no exception.  Ports raise NotImplementedError for some
+# unsupported native modules.
+
+for _name in (
+    "board",
+    "busio",
+    "analogio",
+    "microcontroller",
+    "storage",
+    "wifi",               # Pico W / ESP32-S2/S3 only
+    "socketpool",
+    "adafruit_requests",
+    "orjson",             # CPython test harness / ports that ship it
+):
+    _mod = sys.modules.get(_name)
+    if _mod is None:
+        try:
+            _mod = __import__(_name)
+        except (ImportError, NotImplementedError):
+            pass
+    globals()[_name] = _mod
+del _name, _mod
+
+# ── Chipset registry ──────────────────────────────────────────────────────────
+# {address: (chipset, type, provides, extra)} from chipsets/__init__.py.
+
+try:
+    from chipsets import REGISTRY as _CHIPSETS, HEX as _HEX
+except ImportError:
+    _CHIPSETS = {}
+    _HEX = tuple("0x%02x" % i for i in range(256))
+
+
+def _cap_template(entry):
+    name, kind, provides, extra = entry
+    cap = {"type": kind, "chipset": name, "bus": "i2c"}
+    if extra:
+        cap.update(extra)
+    if provides:
+        cap["provides"] = provides
+    return cap
 
-# ── Chipset plugin registry ───────────────────────────────────────────────────
-# Same model as MicroPython: each chipset has CHIPSET dict + describe()
+# Capability dict per address, minus bus_id/address, built once at import so
+# detection is a dict copy plus one update per chip.
+_CHIPSET_CAPS = {a: _cap_template(e) for a, e in _CHIPSETS.items()}
 
-_CHIPSET_PLUGINS = {}
 
-def load_chipset_plugins():
-    """Load chipset plugins from the chipsets/ sub-package."""
-    plugin_names = []
-    try:
-        from chipsets import PLUGIN_LIST
-        plugin_names = PLUGIN_LIST
-    except Exception:
-        pass
+# ── Board pins ────────────────────────────────────────────────────────────────
+# Numbered D<n> / A<n> pin names from the board module, enumerated once at
+# import instead of walking dir(board) on every capability build.
 
-    for name in plugin_names:
-        try:
-            mod = __import__("chipsets." + name, globals(), locals(), [name], 0)
-            chip = getattr(mod, "CHIPSET", None)
-            if chip:
-                for addr in chip.get("i2c_addresses", []):
-                    _CHIPSET_PLUGINS[addr] = mod
-        except Exception:
-            pass
+_GPIO_PINS, _ADC_PINS = [], []
+if board:
+    for _attr in dir(board):
+        if len(_attr) >= 2 and _attr[1:].isdigit():
+            if _attr[0] == "D":
+                _GPIO_PINS.append(int(_attr[1:]))
+            elif _attr[0] == "A":
+                _ADC_PINS.append(int(_attr[1:]))
+    _GPIO_PINS.sort()
+    _ADC_PINS.sort()
 
 
 # ── Device identity ───────────────────────────────────────────────────────────
@@ -78,7 +115,6 @@ def _board_model():
 
 
 def _firmware():
-    import sys
     try:
         v = sys.implementation.version
         return "{}.{}.{}".format(*v)
@@ -86,6 +122,17 @@ def _firmware():
         return "unknown"
 
 
+# Hardware ID, board and firmware can't change while running, so the static
+# part of the device block is computed once; getCapabilitiesJSON() copies it
+# and adds transport / reportedAt.
+_DEVICE_BLOCK = {
+    "id":       _device_id(),
+    "class":    "microcontroller",
+    "model":    _board_model(),
+    "firmware": _firmware(),
+}
+
+
 # ── Capability detectors ─────────────────────────────────────────────────────
 
 def detect_compute():
@@ -109,8 +156,14 @@ def _named_pin(attr):
         return None
 
 
+# busio.I2C claims its pins until deinit(), so one instance is created on
+# first scan and shared; close() releases it.
+_I2C_SHARED = None
+
+
 def scan_i2c():
     """Scan I2C on board.SDA/SCL if available."""
+    global _I2C_SHARED
     if not busio:
         return [], {}
 
@@ -123,7 +176,9 @@ def scan_i2c():
     found_map = {}
 
     try:
-        i2c = busio.I2C(scl, sda, frequency=100_000)
+        if _I2C_SHARED is None:
+            _I2C_SHARED = busio.I2C(scl, sda, frequency=100_000)
+        i2c = _I2C_SHARED
 
         # Wait for lock
         while not i2c.try_lock():
@@ -133,7 +188,7 @@ def scan_i2c():
         finally:
             i2c.unlock()
 
-        hex_addrs = ["0x{:02x}".format(a) for a in addrs]
+        hex_addrs = [_HEX[a] for a in addrs]
         i2c_caps.append({
             "type":  "i2c",
             "buses": [{
@@ -145,7 +200,7 @@ def scan_i2c():
             }]
         })
         for a in addrs:
-            found_map[a] = {"bus_id": 0, "address": "0x{:02x}".format(a)}
+            found_map[a] = {"bus_id": 0, "address": _HEX[a]}
     except Exception:
         pass
 
@@ -153,37 +208,20 @@ def scan_i2c():
 
 
 def detect_chipsets(found_map):
-    sensors = []
-    for addr_int, location in found_map.items():
-        plugin = _CHIPSET_PLUGINS.get(addr_int)
-        if plugin:
-            try:
-                cap = plugin.describe(location["bus_id"], addr_int)
-            except AttributeError:
-                chip = plugin.CHIPSET
-                cap = {
-                    "type":     "sensor",
-                    "chipset":  chip["name"],
-                    "bus":      "i2c",
-                    "bus_id":   location["bus_id"],
-                    "address":  location["address"],
-                    "provides": chip.get("provides", []),
-                }
-            sensors.append(cap)
-    return sensors
+    """
+    Cross-reference discovered I2C addresses against the chipset registry.
+    Returns a list of sensor capability dicts.
+    """
+    return [dict(_CHIPSET_CAPS[addr_int], **location)
+            for addr_int, location in found_map.items()
+            if addr_int in _CHIPSET_CAPS]
 
 
 def detect_analog():
     """Report analog-capable pins the board advertises."""
-    if not analogio:
-        return None
-    pins = []
-    for attr in dir(board):
-        if attr.startswith("A") and attr[1:].isdigit():
-            pins.append(int(attr[1:]))
-    if not pins:
+    if not analogio or not _ADC_PINS:
         return None
-    return {"type": "adc", "pins": sorted(pins), "resolution": 16}
+    return {"type": "adc", "pins": _ADC_PINS, "resolution": 16}
 
 
 def detect_network():
@@ -228,16 +266,28 @@ def detect_neopixel():
 
 # ── Main public API ───────────────────────────────────────────────────────────
 
-def getCapabilitiesJSON():
+# The capability document only changes between boots, so the built dict and
+# its serialized body are kept here until force_refresh=True.
+_CACHED_DOC   = None
+_CACHED_PARTS = None  # (aliases, fragments) — see _static_parts()
+
+
+def getCapabilitiesJSON(force_refresh=False):
     """
     Build and return the full CEP capability document as a Python dict.
 
+    The document is cached after the first call (treat it as read-only);
+    pass force_refresh=True to re-scan I2C and rebuild it.
+
     Example:
         from cep import getCapabilitiesJSON
         import json
         print(json.dumps(getCapabilitiesJSON()))
     """
-    load_chipset_plugins()
+    global _CACHED_DOC, _CACHED_PARTS
+
+    if not force_refresh and _CACHED_DOC is not None:
+        return _CACHED_DOC
 
     capabilities = []
 
@@ -262,43 +312,141 @@ def getCapabilitiesJSON():
         capabilities.append(net_cap)
 
     # GPIO — report named digital pins from board module
-    gpio_pins = []
-    if board:
-        for attr in dir(board):
-            if attr.startswith("D") and attr[1:].isdigit():
-                gpio_pins.append(int(attr[1:]))
-    if gpio_pins:
-        capabilities.append({"type": "gpio", "pins": sorted(gpio_pins)})
+    if _GPIO_PINS:
+        capabilities.append({"type": "gpio", "pins": _GPIO_PINS})
+
+    device = dict(_DEVICE_BLOCK)
+    device["transport"]  = "network" if net_cap else "usb"
+    device["reportedAt"] = _iso_now()
 
     doc = {
-        "device": {
-            "id":         _device_id(),
-            "class":      "microcontroller",
-            "transport":  "network" if net_cap else "usb",
-            "model":      _board_model(),
-            "firmware":   _firmware(),
-            "reportedAt": _iso_now(),
-        },
+        "device":       device,
         "capabilities": capabilities,
     }
+    _CACHED_DOC   = doc
+    _CACHED_PARTS = None
     return doc
 
 
 # ── Registration helper ───────────────────────────────────────────────────────
+# Same scheme as the MicroPython shim: the boot-stable parts of the document
+# are serialized once and only transport / reportedAt / network are encoded
+# per registration.  Empty / None fields are dropped before serializing.
+
+def _dumps(obj):
+    """Serialize to JSON bytes — orjson when available, else stdlib json."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+
+_EMPTY = (None, "", [], {}, ())
 
-def register_with_jumpnet(base_url):
-    """POST this device's CEP document to a JumpNet node."""
+
+def _compact(obj):
+    """Drop None / empty-string / empty-container values, recursively."""
+    if isinstance(obj, dict):
+        return {k: _compact(v) for k, v in obj.items() if v not in _EMPTY}
+    if isinstance(obj, list):
+        return [_compact(x) for x in obj]
+    return obj
+
+
+def _rekey(obj, aliases):
+    """Rename dict keys per aliases ({full: short}), recursively."""
+    if isinstance(obj, dict):
+        return {aliases.get(k, k): _rekey(v, aliases) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rekey(x, aliases) for x in obj]
+    return obj
+
+
+_ALIAS_CACHE = {}   # base_url -> {full_key: short_key} or None
+
+
+def _server_aliases(session, base_url):
+    """
+    Short wire keys advertised at GET /devices/schema as {full_key: short_key},
+    fetched once per server.  None means send full keys.  Only a definitive
+    answer (200 or 404) is cached; after a network error the next
+    registration asks again.
+    """
+    try:
+        return _ALIAS_CACHE[base_url]
+    except KeyError:
+        pass
+    aliases = None
+    try:
+        resp = session.get(base_url + "/devices/schema")
+        try:
+            if resp.status_code == 200:
+                short = resp.json().get("aliases")
+                if short:
+                    aliases = {full: key for key, full in short.items()}
+                _ALIAS_CACHE[base_url] = aliases
+            elif resp.status_code == 404:
+                _ALIAS_CACHE[base_url] = None
+        finally:
+            resp.close()
+    except Exception:
+        pass   # Wi-Fi not up yet, timeout, ...: not cached
+    return aliases
+
+
+def _static_parts(doc, aliases=None):
+    """Return (device_fragment, caps_fragment) without their enclosing {} / []."""
+    device = _compact({k: v for k, v in doc["device"].items()
+                       if k not in ("transport", "reportedAt")})
+    caps   = _compact([c for c in doc["capabilities"] if c["type"] != "network"])
+    if aliases:
+        device = _rekey(device, aliases)
+        caps   = _rekey(caps, aliases)
+    return _dumps(device)[1:-1], _dumps(caps)[1:-1]
+
+
+def _render_body(parts, net_cap, aliases=None):
+    """Splice the dynamic fields onto the cached static fragments."""
+    dev_part, caps_part = parts
+    aliases = aliases or {}
+    tail = caps_part
+    if net_cap:
+        tail = (tail + b"," if tail else b"") + _dumps(net_cap)
+    return (b"{" + _dumps(aliases.get("device", "device")) + b":{" + dev_part
+            + b"," + _dumps(aliases.get("transport", "transport")) + b":"
+            + _dumps("network" if net_cap else "usb")
+            + b"," + _dumps(aliases.get("reportedAt", "reportedAt")) + b":"
+            + _dumps(_iso_now())
+            + b"}," + _dumps(aliases.get("capabilities", "capabilities")) + b":["
+            + tail + b"]}")
+
+
+def register_with_jumpnet(base_url, force_refresh=False, compact=True):
+    """
+    POST this device's CEP document to a JumpNet node.
+
+    The body is encoded with orjson when available (faster, more compact
+    output), else stdlib json.  Its boot-stable part is cached with the
+    document, so repeated calls only re-read network state and the
+    timestamp; force_refresh=True rebuilds everything.  compact=True uses
+    the short field names the server advertises at GET /devices/schema.
+    """
+    global _CACHED_PARTS
     if not wifi or not socketpool or not adafruit_requests:
         print("[CEP] WiFi/requests not available.")
         return False
     try:
-        pool    = socketpool.SocketPool(wifi.radio)
-        session = adafruit_requests.Session(pool)
-        doc     = getCapabilitiesJSON()
-        resp    = session.post(
-            base_url.rstrip("/") + "/devices/register",
+        base_url = base_url.rstrip("/")
+        pool     = socketpool.SocketPool(wifi.radio)
+        session  = adafruit_requests.Session(pool)
+        aliases  = _server_aliases(session, base_url) if compact else None
+        doc      = getCapabilitiesJSON(force_refresh)
+        if _CACHED_PARTS is None or _CACHED_PARTS[0] is not aliases:
+            _CACHED_PARTS = (aliases, _static_parts(doc, aliases))
+        net_cap = _compact(detect_network())
+        if net_cap and aliases:
+            net_cap = _rekey(net_cap, aliases)
+        resp = session.post(
+            base_url + "/devices/register",
             headers={"Content-Type": "application/json"},
-            json=doc,
+            data=_render_body(_CACHED_PARTS[1], net_cap, aliases),
         )
         ok = resp.status_code in (200, 201)
         resp.close()
@@ -308,11 +456,32 @@ def register_with_jumpnet(base_url):
         return False
 
 
+def close():
+    """Release the shared I2C bus so other code can claim board.SDA/SCL."""
+    global _I2C_SHARED
+    if _I2C_SHARED is not None:
+        try:
+            _I2C_SHARED.deinit()
+        except Exception:
+            pass
+        _I2C_SHARED = None
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Zero-padded digit tables: string concatenation is much cheaper than
+# str.format() on MicroPython.  Years outside 2000-2099 fall back to format().
+_DEC2 = tuple("%02d" % i for i in range(100))
+_DEC4 = tuple("%04d" % i for i in range(2000, 2100))
+
+
 def _iso_now():
     try:
         t = time.localtime()
+        y = t[0] - 2000
+        if 0 <= y < 100:
+            return (_DEC4[y] + "-" + _DEC2[t[1]] + "-" + _DEC2[t[2]] + "T"
+                    + _DEC2[t[3]] + ":" + _DEC2[t[4]] + ":" + _DEC2[t[5]] + "Z")
         return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(*t[:6])
     except Exception:
         return "1970-01-01T00:00:00Z"
@@ -1,15 +1,36 @@
 """
 clients/circuitpython/chipsets/__init__.py
 
-Lists CircuitPython chipset plugin module names.
-Same architecture as MicroPython chipsets — shared plugins are compatible.
+Chipset registry for the CEP auto-detector.
+Every known I2C chip lives in the single REGISTRY table below instead of one
+plugin module per chip, so detection costs no extra imports off flash.
+Same table as clients/micropython/chipsets — keep the two in sync.
 """
 
-PLUGIN_LIST = [
-    "bme280",
-    "ssd1306",
-    "mpu6050",
-    "ina219",
-    "ads1115",
-    "ds3231",
-]
+# address -> (chipset, capability type, provides, extra fields or None)
+REGISTRY = {
+    # Bosch BME280: temperature, humidity, pressure (SDO=GND / SDO=VCC)
+    0x76: ("bme280",  "sensor",  ("temperature", "humidity", "pressure"), None),
+    0x77: ("bme280",  "sensor",  ("temperature", "humidity", "pressure"), None),
+    # SSD1306 OLED display controller
+    0x3C: ("ssd1306", "display", None, {"width_px": 128, "height_px": 64, "color": False}),
+    0x3D: ("ssd1306", "display", None, {"width_px": 128, "height_px": 64, "color": False}),
+    # TI INA219 current/voltage sensor (A0/A1 pins)
+    0x40: ("ina219",  "sensor",  ("voltage", "current", "power"), None),
+    0x41: ("ina219",  "sensor",  ("voltage", "current", "power"), None),
+    0x44: ("ina219",  "sensor",  ("voltage", "current", "power"), None),
+    0x45: ("ina219",  "sensor",  ("voltage", "current", "power"), None),
+    # TI ADS1115 4-channel 16-bit ADC (ADDR pin)
+    0x48: ("ads1115", "adc",     ("adc",), {"resolution": 16, "channels": 4}),
+    0x49: ("ads1115", "adc",     ("adc",), {"resolution": 16, "channels": 4}),
+    0x4A: ("ads1115", "adc",     ("adc",), {"resolution": 16, "channels": 4}),
+    0x4B: ("ads1115", "adc",     ("adc",), {"resolution": 16, "channels": 4}),
+    # Maxim DS3231 RTC — shares 0x68 with the MPU-6050 (AD0=GND); the RTC wins
+    0x68: ("ds3231",  "sensor",  ("rtc", "temperature"), None),
+    # InvenSense MPU-6050 IMU (AD0=VCC)
+    0x69: ("mpu6050", "sensor",  ("acceleration", "gyroscope", "temperature"), None),
+}
+
+# "0x%02x" for every byte value, built once at import.  Shared by the CEP shim
+# so address formatting is a tuple index, not str.format().
+HEX = tuple("0x%02x" % i for i in range(256))
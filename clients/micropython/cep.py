@@ -21,44 +21,55 @@ import time
 
 # ── Soft imports (not all boards have every module) ────────────────────────────
 
-def _try_import(name):
-    try:
-        return __import__(name)
-    except ImportError:
-        return None
-
-network  = _try_import("network")
-uos      = _try_import("uos")
-ubinascii = _try_import("ubinascii")
-urequests = _try_import("urequests")
-
-# ── Chipset plugin registry ────────────────────────────────────────────────────
-# Loaded lazily from the chipsets/ sub-directory.
-# Each plugin is a module with a CHIPSET dict and an optional describe() fn.
-
-_CHIPSET_PLUGINS = {}
+# Resolved once at import: (global, candidate modules), first importable wins.
+# sys.modules is checked first so already-loaded modules cost no exception.
+
+for _name, _mods in (
+    ("network",   ("network",)),
+    ("uos",       ("uos",)),
+    ("ubinascii", ("ubinascii",)),
+    ("urequests", ("urequests",)),
+    ("socket",    ("usocket", "socket")),
+    ("cbor",      ("cbor2", "cbor")),
+):
+    _mod = None
+    for _m in _mods:
+        _mod = sys.modules.get(_m)
+        if _mod is None:
+            try:
+                _mod = __import__(_m)
+            except ImportError:
+                pass
+        if _mod is not None:
+            break
+    globals()[_name] = _mod
+del _name, _mods, _mod, _m
+
+# ── Chipset registry ──────────────────────────────────────────────────────────
+# {address: (chipset, type, provides, extra)} from chipsets/__init__.py.
+
+try:
+    from chipsets import REGISTRY as _CHIPSETS, HEX as _HEX
+except ImportError:
+    _CHIPSETS = {}
+    _HEX = tuple("0x%02x" % i for i in range(256))
+
+
+def _cap_template(entry):
+    name, kind, provides, extra = entry
+    cap = {"type": kind, "chipset": name, "bus": "i2c"}
+    if extra:
+        cap.update(extra)
+    if provides:
+        cap["provides"] = provides
+    return cap
 
-def load_chipset_plugins():
-    """
-    Import every module in the chipsets/ package and register it by its
-    CHIPSET['i2c_addresses'] list.  Silently skips modules that fail to load.
-    """
-    plugin_names = []
-    try:
-        from chipsets import PLUGIN_LIST  # chipsets/__init__.py exports this
-        plugin_names = PLUGIN_LIST
-    except Exception:
-        pass
+# Capability dict per address, minus bus_id/address, built once at import so
+# detection is a dict copy plus one update per chip.
+_CHIPSET_CAPS = {a: _cap_template(e) for a, e in _CHIPSETS.items()}
 
-    for name in plugin_names:
-        try:
-            mod = __import__("chipsets." + name, globals(), locals(), [name], 0)
-            chip = getattr(mod, "CHIPSET", None)
-            if chip:
-                for addr in chip.get("i2c_addresses", []):
-                    _CHIPSET_PLUGINS[addr] = mod
-        except Exception:
-            pass
+# Addresses probed by the default (targeted) I2C scan.
+_KNOWN_I2C_ADDRS = tuple(sorted(_CHIPSETS))
 
 
 # ── Device identity ────────────────────────────────────────────────────────────
@@ -68,7 +79,7 @@ def _device_id():
         uid = machine.unique_id()
         if ubinascii:
             return ubinascii.hexlify(uid).decode()
-        return "".join("{:02x}".format(b) for b in uid)
+        return "".join(_HEX[b][2:] for b in uid)
     except Exception:
         return "unknown"
 
@@ -91,6 +102,17 @@ def _firmware():
         return "unknown"
 
 
+# Hardware ID, board and firmware can't change while running, so the static
+# part of the device block is computed once; getCapabilitiesJSON() copies it
+# and adds transport / reportedAt.
+_DEVICE_BLOCK = {
+    "id":       _device_id(),
+    "class":    "microcontroller",
+    "model":    _board_model(),
+    "firmware": _firmware(),
+}
+
+
 # ── Capability detectors ───────────────────────────────────────────────────────
 
 def detect_compute():
@@ -109,12 +131,43 @@ def detect_compute():
     return cap
 
 
-def scan_i2c(bus_configs=None):
+# machine.I2C instances keyed by (bus_id, sda, scl), reused across scans so
+# capability rebuilds don't re-initialise the peripheral.
+_I2C_CACHE = {}
+
+
+def _get_i2c(bus_id, sda, scl):
+    key = (bus_id, sda, scl)
+    try:
+        return _I2C_CACHE[key]
+    except KeyError:
+        i2c = machine.I2C(bus_id, sda=machine.Pin(sda), scl=machine.Pin(scl), freq=100_000)
+        _I2C_CACHE[key] = i2c
+        return i2c
+
+
+def _probe_addrs(i2c):
+    """ACK-probe only the registry's addresses instead of all 128."""
+    found = []
+    for a in _KNOWN_I2C_ADDRS:
+        try:
+            i2c.writeto(a, b"")
+            found.append(a)
+        except OSError:
+            pass
+    return found
+
+
+def scan_i2c(bus_configs=None, full_scan=False):
     """
     Scan I2C buses.  bus_configs is a list of (bus_id, sda_pin, scl_pin).
     Defaults to common ESP32 pins if not supplied.
-    Returns a list of capability dicts and a dict of {address: module} for
+    Returns a list of capability dicts and a dict of {address: location} for
     chipset matching.
+
+    By default only addresses in the chipset registry are probed, so
+    devices_found lists known chips only; full_scan=True sweeps the whole
+    0x00-0x7F range with i2c.scan().
     """
     if bus_configs is None:
         bus_configs = [
@@ -126,9 +179,9 @@ def scan_i2c(bus_configs=None):
 
     for bus_id, sda, scl in bus_configs:
         try:
-            i2c = machine.I2C(bus_id, sda=machine.Pin(sda), scl=machine.Pin(scl), freq=100_000)
-            addrs = i2c.scan()
-            hex_addrs = ["0x{:02x}".format(a) for a in addrs]
+            i2c = _get_i2c(bus_id, sda, scl)
+            addrs = i2c.scan() if full_scan else _probe_addrs(i2c)
+            hex_addrs = [_HEX[a] for a in addrs]
             i2c_caps.append({
                 "type":  "i2c",
                 "buses": [{
@@ -140,7 +193,7 @@ def scan_i2c(bus_configs=None):
                 }]
             })
             for a in addrs:
-                found_map[a] = {"bus_id": bus_id, "address": "0x{:02x}".format(a)}
+                found_map[a] = {"bus_id": bus_id, "address": _HEX[a]}
         except Exception:
             pass
 
@@ -149,27 +202,12 @@ def scan_i2c(bus_configs=None):
 
 def detect_chipsets(found_map):
     """
-    Cross-reference discovered I2C addresses against loaded chipset plugins.
+    Cross-reference discovered I2C addresses against the chipset registry.
     Returns a list of sensor capability dicts.
     """
-    sensors = []
-    for addr_int, location in found_map.items():
-        plugin = _CHIPSET_PLUGINS.get(addr_int)
-        if plugin:
-            try:
-                cap = plugin.describe(location["bus_id"], addr_int)
-            except AttributeError:
-                chip = plugin.CHIPSET
-                cap = {
-                    "type":     "sensor",
-                    "chipset":  chip["name"],
-                    "bus":      "i2c",
-                    "bus_id":   location["bus_id"],
-                    "address":  location["address"],
-                    "provides": chip.get("provides", []),
-                }
-            sensors.append(cap)
-    return sensors
+    return [dict(_CHIPSET_CAPS[addr_int], **location)
+            for addr_int, location in found_map.items()
+            if addr_int in _CHIPSET_CAPS]
 
 
 def detect_network():
@@ -180,7 +218,7 @@ def detect_network():
         wlan = network.WLAN(network.STA_IF)
         ifconf = wlan.ifconfig() if wlan.isconnected() else ("0.0.0.0", "0.0.0.0", "0.0.0.0", "0.0.0.0")
         mac_bytes = wlan.config("mac")
-        mac_str   = ":".join("{:02x}".format(b) for b in mac_bytes)
+        mac_str   = ":".join(_HEX[b][2:] for b in mac_bytes)
 
         iface = {
             "kind": "wifi",
@@ -209,34 +247,89 @@ def detect_gpio(output_pins=None, input_pins=None):
     return cap
 
 
+# ADC-capable GPIOs per port, so the default capability report needs no
+# hardware access.  sys.platform is "esp32" on every ESP32 variant, so those
+# are keyed by chip name instead; see _adc_table_key().
+_ADC_TABLE = {
+    "esp32":   [32, 33, 34, 35, 36, 39],           # ADC1 channels
+    "esp32s2": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],    # ADC1 channels
+    "esp32s3": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],    # ADC1 channels
+    "esp32c3": [0, 1, 2, 3, 4],                    # ADC1 channels
+    "esp32c6": [0, 1, 2, 3, 4, 5, 6],              # ADC1 channels
+    "rp2":     [26, 27, 28],
+}
+
+
+def _adc_table_key():
+    platform = sys.platform
+    if platform != "esp32":
+        return platform
+    # The chip follows the last "with" in the model string, e.g.
+    # "Generic ESP32S2 module with ESP32S2" or "UM FeatherS2 with ESP32-S2".
+    # Without it the variant is unknown and no pins are assumed.
+    model = _board_model().upper().replace("-", "")
+    if " WITH " not in model:
+        return None
+    return model.rsplit(" WITH ", 1)[1].strip().lower()
+
+
 def detect_adc(pins=None):
-    """Probe ADC-capable pins (ESP32 ADC1 defaults if not provided)."""
+    """
+    Report ADC-capable pins.  By default they come from _ADC_TABLE for this
+    port without touching the hardware; pass an explicit pins list to probe
+    each one at runtime instead.
+    """
     if pins is None:
-        # ESP32 ADC1 channels
-        pins = [32, 33, 34, 35, 36, 39]
-    working = []
-    for p in pins:
-        try:
-            adc = machine.ADC(machine.Pin(p))
-            adc.read()   # will raise if pin not usable
-            working.append(p)
-        except Exception:
-            pass
+        working = _ADC_TABLE.get(_adc_table_key(), [])
+    else:
+        working = []
+        for p in pins:
+            try:
+                adc = machine.ADC(machine.Pin(p))
+                adc.read()   # will raise if pin not usable
+                working.append(p)
+            except Exception:
+                pass
     if not working:
         return None
     return {"type": "adc", "pins": working, "resolution": 12}
 
 
-def detect_neopixel(candidate_pins=None):
+# Boards with an on-board NeoPixel, matched as a substring of _board_model()
+# (sys.implementation._machine, e.g. "Adafruit Feather RP2040 with RP2040").
+# The MicroPython equivalent of CircuitPython's board.NEOPIXEL.
+_NEOPIXEL_BY_BOARD = {
+    "Feather RP2040":   16,
+    "QT Py RP2040":     12,
+    "ItsyBitsy RP2040": 17,
+    "TinyS3":           18,
+}
+
+
+def detect_neopixel(candidate_pins=None, aggressive=False):
     """
-    Try to identify a NeoPixel bus by sending a minimal pulse and checking
-    if the operation succeeds.  Returns a capability dict or None.
+    Identify the board's NeoPixel pin from _NEOPIXEL_BY_BOARD.
+    Returns a capability dict or None.
+
+    With aggressive=True, unknown boards fall back to driving a one-pixel
+    pulse on each of candidate_pins and reporting the first that accepts
+    it.  This writes to GPIOs that may be wired to other peripherals, so it
+    is opt-in only.
     """
+    model = _board_model()
+    for name, pin_no in _NEOPIXEL_BY_BOARD.items():
+        if name in model:
+            return {"type": "neopixel", "pin": pin_no, "max_leds": 64}
+
+    if not aggressive:
+        return None
+
     if candidate_pins is None:
         candidate_pins = [5, 13, 27, 16]
 
-    neopixel_mod = _try_import("neopixel")
-    if not neopixel_mod:
+    try:
+        import neopixel as neopixel_mod
+    except ImportError:
         return None
 
     for pin_no in candidate_pins:
@@ -266,25 +359,49 @@ def detect_storage():
 
 # ── Main public API ───────────────────────────────────────────────────────────
 
+# The capability document only changes between boots, so the built dict and
+# its serialized body are kept here.  Both are dropped whenever the document
+# is rebuilt (different hints, or force_refresh=True).
+_CACHED_DOC   = None
+_CACHED_KEY   = None
+_CACHED_PARTS = None  # (aliases, fragments) — see _static_parts()
+
+
 def getCapabilitiesJSON(
     i2c_buses=None,
     gpio_out=None,
     gpio_in=None,
     adc_pins=None,
     neopixel_candidates=None,
+    neopixel_probe=False,
+    i2c_full_scan=False,
+    force_refresh=False,
 ):
     """
     Build and return the full CEP capability document as a Python dict.
 
     Parameters let callers hint pin assignments for boards where
-    auto-detection is ambiguous.
+    auto-detection is ambiguous.  neopixel_probe=True enables the
+    pin-driving NeoPixel probe over neopixel_candidates on boards not in
+    _NEOPIXEL_BY_BOARD.  i2c_full_scan=True reports every I2C address that
+    ACKs, not just known chipsets.
+
+    The document is cached after the first call; later calls with the same
+    hints return the cached dict (treat it as read-only) without re-scanning
+    I2C or re-probing pins.  Pass force_refresh=True after hot-plugging
+    hardware to rebuild it.
 
     Example:
         from cep import getCapabilitiesJSON
         import ujson
         print(ujson.dumps(getCapabilitiesJSON()))
     """
-    load_chipset_plugins()
+    global _CACHED_DOC, _CACHED_KEY, _CACHED_PARTS
+
+    key = (i2c_buses, gpio_out, gpio_in, adc_pins, neopixel_candidates, neopixel_probe,
+           i2c_full_scan)
+    if not force_refresh and _CACHED_DOC is not None and key == _CACHED_KEY:
+        return _CACHED_DOC
 
     capabilities = []
 
@@ -292,7 +409,7 @@ def getCapabilitiesJSON(
     capabilities.append(detect_compute())
 
     # I2C + chipset sensors
-    i2c_caps, found_map = scan_i2c(i2c_buses)
+    i2c_caps, found_map = scan_i2c(i2c_buses, i2c_full_scan)
     capabilities.extend(i2c_caps)
     capabilities.extend(detect_chipsets(found_map))
 
@@ -302,7 +419,7 @@ def getCapabilitiesJSON(
         capabilities.append(adc_cap)
 
     # NeoPixel
-    neo_cap = detect_neopixel(neopixel_candidates)
+    neo_cap = detect_neopixel(neopixel_candidates, neopixel_probe)
     if neo_cap:
         capabilities.append(neo_cap)
 
@@ -318,53 +435,251 @@ def getCapabilitiesJSON(
     if net_cap:
         capabilities.append(net_cap)
 
+    device = dict(_DEVICE_BLOCK)
+    device["transport"]  = "network" if net_cap else "usb"
+    device["reportedAt"] = _iso_now()
+
     doc = {
-        "device": {
-            "id":         _device_id(),
-            "class":      "microcontroller",
-            "transport":  "network" if net_cap else "usb",
-            "model":      _board_model(),
-            "firmware":   _firmware(),
-            "reportedAt": _iso_now(),
-        },
+        "device":       device,
         "capabilities": capabilities,
     }
+    _CACHED_DOC   = doc
+    _CACHED_KEY   = key
+    _CACHED_PARTS = None
     return doc
 
 
 # ── Registration helper ───────────────────────────────────────────────────────
+# Everything in the document except device.transport, device.reportedAt and
+# the network capability is fixed between boots.  Those stable parts are
+# serialized once; each registration only encodes the small dynamic tail and
+# streams it to the socket next to the cached fragments as separate HTTP
+# chunks, so the full body is never materialized in RAM.  Empty / None fields
+# are dropped before serializing to keep the body small.
+
+_EMPTY = (None, "", [], {}, ())
+
+
+def _compact(obj):
+    """Drop None / empty-string / empty-container values, recursively."""
+    if isinstance(obj, dict):
+        return {k: _compact(v) for k, v in obj.items() if v not in _EMPTY}
+    if isinstance(obj, list):
+        return [_compact(x) for x in obj]
+    return obj
+
+
+def _rekey(obj, aliases):
+    """Rename dict keys per aliases ({full: short}), recursively."""
+    if isinstance(obj, dict):
+        return {aliases.get(k, k): _rekey(v, aliases) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rekey(x, aliases) for x in obj]
+    return obj
+
+
+_ALIAS_CACHE = {}   # base_url -> {full_key: short_key} or None
+
 
-def register_with_jumpnet(base_url, **kwargs):
+def _server_aliases(base_url):
+    """
+    Short wire keys advertised by the server at GET /devices/schema, as
+    {full_key: short_key}.  Fetched once per server; None if the server
+    doesn't advertise any (older JumpNet), in which case full keys are sent.
+    Only a definitive answer (200 or 404) is cached; after a network error
+    the next registration asks again.
+    """
+    try:
+        return _ALIAS_CACHE[base_url]
+    except KeyError:
+        pass
+    aliases = None
+    if urequests:
+        try:
+            resp = urequests.get(base_url + "/devices/schema")
+            try:
+                if resp.status_code == 200:
+                    short = resp.json().get("aliases")
+                    if short:
+                        aliases = {full: key for key, full in short.items()}
+                    _ALIAS_CACHE[base_url] = aliases
+                elif resp.status_code == 404:
+                    _ALIAS_CACHE[base_url] = None
+            finally:
+                resp.close()
+        except Exception:
+            pass   # Wi-Fi not up yet, timeout, ...: not cached
+    return aliases
+
+
+def _static_parts(doc, aliases=None):
+    """Return (device_fragment, n_device_keys, caps_fragment, n_caps) as bytes."""
+    device = _compact({k: v for k, v in doc["device"].items()
+                       if k not in ("transport", "reportedAt")})
+    caps   = _compact([c for c in doc["capabilities"] if c["type"] != "network"])
+    if aliases:
+        device = _rekey(device, aliases)
+        caps   = _rekey(caps, aliases)
+    if cbor:
+        dev_part  = b"".join(cbor.dumps(k) + cbor.dumps(v) for k, v in device.items())
+        caps_part = b"".join(cbor.dumps(c) for c in caps)
+    else:
+        # Strip the enclosing {} / [] so the dynamic fields can be appended.
+        dev_part  = ujson.dumps(device)[1:-1].encode()
+        caps_part = ujson.dumps(caps)[1:-1].encode()
+    return dev_part, len(device), caps_part, len(caps)
+
+
+def _cbor_head(major, n):
+    """CBOR initial byte(s) for a map/array header of n entries."""
+    if n < 24:
+        return bytes((major << 5 | n,))
+    if n < 256:
+        return bytes((major << 5 | 24, n))
+    return bytes((major << 5 | 25, n >> 8, n & 0xFF))
+
+
+def _render_chunks(parts, net_cap, aliases=None):
+    """
+    Return (chunks, content_type): the body as a list of bytes pieces, with
+    the cached static fragments passed through uncopied.  net_cap must
+    already be compacted / re-keyed.
+    """
+    dev_part, n_dev, caps_part, n_caps = parts
+    transport = "network" if net_cap else "usb"
+    now       = _iso_now()
+    aliases   = aliases or {}
+    k_dev     = aliases.get("device", "device")
+    k_caps    = aliases.get("capabilities", "capabilities")
+    if cbor:
+        return [
+            _cbor_head(5, 2) + cbor.dumps(k_dev) + _cbor_head(5, n_dev + 2),
+            dev_part,
+            cbor.dumps(aliases.get("transport", "transport")) + cbor.dumps(transport)
+            + cbor.dumps(aliases.get("reportedAt", "reportedAt")) + cbor.dumps(now)
+            + cbor.dumps(k_caps) + _cbor_head(4, n_caps + (1 if net_cap else 0)),
+            caps_part,
+            cbor.dumps(net_cap) if net_cap else b"",
+        ], "application/cbor"
+    tail = "]}"
+    if net_cap:
+        tail = ("," if caps_part else "") + ujson.dumps(net_cap) + tail
+    return [
+        ('{"' + k_dev + '":{').encode(),
+        dev_part,
+        (',"' + aliases.get("transport", "transport") + '":' + ujson.dumps(transport)
+         + ',"' + aliases.get("reportedAt", "reportedAt") + '":' + ujson.dumps(now)
+         + '},"' + k_caps + '":[').encode(),
+        caps_part,
+        tail.encode(),
+    ], "application/json"
+
+
+def _post_chunked(url, ctype, chunks):
+    """
+    POST chunks over a raw socket with Transfer-Encoding: chunked.
+    Plain http:// only.  Returns the HTTP status code.
+    """
+    _, _, netloc, path = url.split("/", 3)
+    host, port = netloc, 80
+    if ":" in netloc:
+        host, port = netloc.split(":", 1)
+        port = int(port)
+    addr = socket.getaddrinfo(host, port)[0][-1]
+    sock = socket.socket()
+    try:
+        sock.connect(addr)
+        sock.sendall(("POST /{} HTTP/1.1\r\nHost: {}\r\nContent-Type: {}\r\n"
+                      "Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+                      .format(path, netloc, ctype)).encode())
+        for chunk in chunks:
+            if chunk:   # a zero-length chunk would end the body early
+                sock.sendall(("%x\r\n" % len(chunk)).encode())
+                sock.sendall(chunk)
+                sock.sendall(b"\r\n")
+        sock.sendall(b"0\r\n\r\n")
+        status_line = sock.recv(64)   # b"HTTP/1.1 201 Created\r\n..."
+        return int(status_line.split(None, 2)[1])
+    finally:
+        sock.close()
+
+
+def register_with_jumpnet(base_url, compact=True, **kwargs):
     """
     POST this device's capability document to JumpNet.
 
+    The body is CBOR-encoded (Content-Type: application/cbor) when a cbor2 /
+    cbor module is installed, which is smaller on the wire than JSON; otherwise
+    it falls back to ujson.  The server accepts both.
+
+    The boot-stable part of the body is serialized once and cached with the
+    document; each call only re-reads the network state and timestamp.  For
+    http:// URLs the pieces are streamed with chunked encoding over a raw
+    socket; https:// (or a port without sockets) goes through urequests.
+
+    With compact=True, field names are shortened to the aliases the server
+    advertises at GET /devices/schema (e.g. "capabilities" -> "c"); servers
+    that don't advertise any get full keys.
+
+    kwargs are passed to getCapabilitiesJSON(), including force_refresh.
+
     Usage:
         register_with_jumpnet("http://192.168.1.100:4080")
     """
-    if not urequests:
+    streaming = socket and base_url.startswith("http://")
+    if not streaming and not urequests:
         print("[CEP] urequests not available — cannot register automatically.")
         return False
+    global _CACHED_PARTS
     try:
-        doc  = getCapabilitiesJSON(**kwargs)
-        body = ujson.dumps(doc)
-        resp = urequests.post(
-            base_url.rstrip("/") + "/devices/register",
-            headers={"Content-Type": "application/json"},
-            data=body,
-        )
-        ok = resp.status_code in (200, 201)
-        resp.close()
-        return ok
+        base_url = base_url.rstrip("/")
+        aliases  = _server_aliases(base_url) if compact else None
+        doc = getCapabilitiesJSON(**kwargs)
+        if _CACHED_PARTS is None or _CACHED_PARTS[0] is not aliases:
+            _CACHED_PARTS = (aliases, _static_parts(doc, aliases))
+        net_cap = detect_network()
+        if net_cap:
+            net_cap = _compact(net_cap)
+            if aliases:
+                net_cap = _rekey(net_cap, aliases)
+        chunks, ctype = _render_chunks(_CACHED_PARTS[1], net_cap, aliases)
+        url = base_url + "/devices/register"
+        if streaming:
+            status = _post_chunked(url, ctype, chunks)
+        else:
+            resp = urequests.post(
+                url,
+                headers={"Content-Type": ctype},
+                data=b"".join(chunks),
+            )
+            status = resp.status_code
+            resp.close()
+        return status in (200, 201)
     except Exception as e:
         print("[CEP] Registration failed:", e)
         return False
 
 
+def close():
+    """Drop the cached I2C bus objects (e.g. before handing the pins to other code)."""
+    _I2C_CACHE.clear()
+
+
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Zero-padded digit tables: string concatenation is much cheaper than
+# str.format() on MicroPython.  Years outside 2000-2099 fall back to format().
+_DEC2 = tuple("%02d" % i for i in range(100))
+_DEC4 = tuple("%04d" % i for i in range(2000, 2100))
+
+
 def _iso_now():
     try:
         t = time.localtime()
+        y = t[0] - 2000
+        if 0 <= y < 100:
+            return (_DEC4[y] + "-" + _DEC2[t[1]] + "-" + _DEC2[t[2]] + "T"
+                    + _DEC2[t[3]] + ":" + _DEC2[t[4]] + ":" + _DEC2[t[5]] + "Z")
         return "{:04d}-{:02d}-{:02d}T{:02d}:{:02d}:{:02d}Z".format(*t[:6])
     except Exception:
         return "1970-01-01T00:00:00Z"
@@ -0,0 +1,19 @@
+# clients/micropython/manifest.py
+#
+# Freezes the CEP shim into a MicroPython firmware image so it runs from flash
+# as precompiled bytecode instead of being parsed from the filesystem at boot.
+#
+# Build (from a MicroPython checkout):
+#     make -C ports/esp32 BOARD=ESP32_GENERIC \
+#          FROZEN_MANIFEST=/path/to/jumpnet/clients/micropython/manifest.py
+#
+# or simply `make firmware MPY_DIR=/path/to/micropython` from this directory.
+#
+# Remove cep.py and chipsets/__init__.py from the board's filesystem after
+# flashing: "" precedes ".frozen" on sys.path, so copies there shadow the
+# frozen modules.
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+module("cep.py", opt=3)
+package("chipsets", opt=3)
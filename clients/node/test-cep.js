@@ -161,6 +161,33 @@ async function run() {
   r = await req('POST', '/devices/register', { capabilities: [] });
   assert('status 400',           r.status === 400);
 
+  // 12. Nested indefinite-length CBOR chunk (must be rejected, not hang)
+  console.log('\n12. POST /devices/register with nested indefinite CBOR chunk (should 400)');
+  const res = await fetch(`${BASE}/devices/register`, {
+    method:  'POST',
+    headers: { 'Content-Type': 'application/cbor' },
+    body:    new Uint8Array([0x5f, 0x5f, 0xff, 0xff]),
+    signal:  AbortSignal.timeout(5000),
+  });
+  assert('status 400',           res.status === 400);
+
+  // 13. 64-bit integer beyond 2^53 in device.id (must be rejected, or /devices breaks)
+  console.log('\n13. POST /devices/register with an oversized CBOR integer (should 400)');
+  const bigId = Buffer.concat([
+    Buffer.from([0xa2, 0x66]), Buffer.from('device'),
+    Buffer.from([0xa1, 0x62]), Buffer.from('id'),
+    Buffer.from([0x1b, 0x80, 0, 0, 0, 0, 0, 0, 0]),
+    Buffer.from([0x6c]), Buffer.from('capabilities'), Buffer.from([0x80]),
+  ]);
+  const big = await fetch(`${BASE}/devices/register`, {
+    method:  'POST',
+    headers: { 'Content-Type': 'application/cbor' },
+    body:    bigId,
+  });
+  assert('status 400',           big.status === 400);
+  r = await req('GET', '/devices');
+  assert('GET /devices still 200', r.status === 200);
+
   // ── Summary ──────────────────────────────────────────────────────────────
   console.log(`\n${'─'.repeat(40)}`);
   console.log(`Passed: ${passed}   Failed: ${failed}`);
@@ -0,0 +1,16 @@
+# clients/python/jumpnet/jumpnet.pxd
+#
+# Cython declarations for jumpnet.py (pure-Python mode).  Ignored by the
+# interpreter; only used when the client is built with
+# JUMPNET_ENABLE_SPEEDUPS=1 (see ../setup.py), which compiles JumpNetClient
+# into an extension type with typed attributes and a C-level _json().
+
+cdef class JumpNetClient:
+    cdef public str base_url
+    cdef object _conn_cls
+    cdef object _host
+    cdef object _port
+    cdef str _prefix
+    cdef object _conn
+
+    cpdef object _json(self, str method, str path, object payload=*)
@@ -1,11 +1,77 @@
 """
 clients/python/jumpnet/jumpnet.py
 JumpNet Python client — zero dependencies (stdlib only).
+Uses orjson and pybase64 (SIMD base64) when they are installed.
 """
 from __future__ import annotations
-import json, base64, urllib.request, urllib.error
+import json, base64, http.client, select
 from pathlib import Path
-from typing import Any
+from urllib.parse import urlsplit
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import orjson
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    from pybase64 import b64encode_as_string as _b64str
+except ImportError:
+    def _b64str(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
+
+# ── multipart ─────────────────────────────────────────────────────────────────
+# Framing is constant per process; each part header is one bytes % substitution.
+_BOUNDARY   = b"----JumpNetPyBoundary123"
+_FIELD_PART = b"--" + _BOUNDARY + b'\r\nContent-Disposition: form-data; name="%s"\r\n\r\n%s\r\n'
+_FILE_PART  = (b"--" + _BOUNDARY + b'\r\nContent-Disposition: form-data; name="file"; filename="%s"\r\n'
+               b"Content-Type: %s\r\n\r\n")
+_TAIL       = b"\r\n--" + _BOUNDARY + b"--\r\n"
+_CTYPE      = "multipart/form-data; boundary=" + _BOUNDARY.decode()
+
+
+def build_multipart(fields: dict[str, str], file: tuple[str, bytes | Path, str]
+                    ) -> tuple[bytearray | Callable[[], Iterator[bytes]], str, int]:
+    """
+    Build a multipart/form-data body from text `fields` plus one file part,
+    given as (filename, data, content_type).
+
+    Returns (body, content_type, length).  For bytes data, body is the
+    complete bytearray.  For a Path, body is a callable returning a fresh
+    iterator that streams the file in 64 KiB chunks, so it is never held in
+    memory whole; call it again to resend.
+    """
+    filename, data, file_type = file
+    head = bytearray()
+    for name, value in fields.items():
+        head += _FIELD_PART % (name.encode(), value.encode())
+    head += _FILE_PART % (filename.encode(), file_type.encode())
+
+    if not isinstance(data, Path):
+        # Appended in place: concatenating bytes would copy the file again.
+        head += data
+        head += _TAIL
+        return head, _CTYPE, len(head)
+
+    head = bytes(head)
+
+    def stream() -> Iterator[bytes]:
+        yield head
+        yield from _file_chunks(data)
+        yield _TAIL
+
+    return stream, _CTYPE, len(head) + data.stat().st_size + len(_TAIL)
+
+
+def _file_chunks(path: Path) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        while chunk := f.read(65536):
+            yield chunk
 
 
 class JumpNetError(RuntimeError):
@@ -14,29 +80,80 @@ class JumpNetError(RuntimeError):
         self.status = status
 
 
+# Methods that are safe to resend when a reused connection fails mid-request.
+_IDEMPOTENT = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
 class JumpNetClient:
     """Minimal Python client for the JumpNet API."""
 
     def __init__(self, base_url: str = "http://localhost:4080"):
         self.base_url = base_url.rstrip("/")
+        url = urlsplit(self.base_url)
+        self._conn_cls = (http.client.HTTPSConnection if url.scheme == "https"
+                          else http.client.HTTPConnection)
+        self._host, self._port, self._prefix = url.hostname, url.port, url.path
+        self._conn: http.client.HTTPConnection | None = None
+
+    def close(self) -> None:
+        """Close the kept-alive connection (reopened on the next request)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> JumpNetClient:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
     # ── helpers ───────────────────────────────────────────────────────────────
-    def _request(self, method: str, path: str, *, data: bytes | None = None,
-                 content_type: str = "application/json") -> Any:
-        req = urllib.request.Request(
-            f"{self.base_url}{path}",
-            data=data,
-            headers={"Content-Type": content_type} if data else {},
-            method=method,
-        )
-        try:
-            with urllib.request.urlopen(req) as resp:
-                return json.loads(resp.read())
-        except urllib.error.HTTPError as e:
-            raise JumpNetError(e.code, e.read().decode()) from e
+    def _request(self, method: str, path: str, *,
+                 data: bytes | bytearray | Callable[[], Iterable[bytes]] | None = None,
+                 content_type: str = "application/json",
+                 length: int | None = None,
+                 headers: dict[str, str] | None = None) -> Any:
+        """
+        Send one request over the kept-alive connection.
+        `data` is either a bytes-like body or, for streamed uploads, a callable
+        returning a fresh iterable of chunks; `length` is then required.
+        """
+        headers = dict(headers or {})
+        if data:
+            headers["Content-Type"] = content_type
+        if length is not None:
+            headers["Content-Length"] = str(length)
+        # One connection is reused across calls. The server closes idle
+        # keep-alive sockets; a readable socket before sending means EOF, so
+        # reconnect up front instead of writing into a dead connection.
+        conn = self._conn
+        if conn is not None and conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+            self.close()
+        while True:
+            reused = self._conn is not None and self._conn.sock is not None
+            if self._conn is None:
+                self._conn = self._conn_cls(self._host, self._port)
+            try:
+                body = data() if callable(data) else data
+                self._conn.request(method, self._prefix + path, body=body, headers=headers)
+                resp = self._conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionError):
+                self.close()
+                # A reused socket may still have been dropped after the check
+                # above; resend once, but never a request that may have run.
+                if not reused or method not in _IDEMPOTENT:
+                    raise
+            except Exception:
+                self.close()
+                raise
+        if resp.status >= 400:
+            raise JumpNetError(resp.status, body.decode(errors="replace"))
+        return _loads(body)
 
     def _json(self, method: str, path: str, payload: Any | None = None) -> Any:
-        data = json.dumps(payload).encode() if payload is not None else None
+        data = _dumps(payload) if payload is not None else None
         return self._request(method, path, data=data)
 
     # ── status ────────────────────────────────────────────────────────────────
@@ -48,12 +165,27 @@ class JumpNetClient:
         if isinstance(image, Path):
             image = image.read_bytes()
         if isinstance(image, bytes):
-            image = base64.b64encode(image).decode()
+            image = _b64str(image)
         payload: dict[str, Any] = {"image": image}
         if bundle_id:
             payload["bundleId"] = bundle_id
         return self._json("POST", "/infer", payload)
 
+    def infer_binary(self, image: bytes | Path, *, bundle_id: str | None = None,
+                     content_type: str = "image/jpeg") -> dict:
+        """
+        Classify an image sent as raw bytes rather than base64 JSON: no
+        encode/decode on either side and a third fewer bytes on the wire.
+        A Path is streamed from disk.
+        """
+        headers = {"X-Bundle-Id": bundle_id} if bundle_id else None
+        if isinstance(image, Path):
+            return self._request("POST", "/infer", data=lambda: _file_chunks(image),
+                                 content_type=content_type, length=image.stat().st_size,
+                                 headers=headers)
+        return self._request("POST", "/infer", data=image, content_type=content_type,
+                             headers=headers)
+
     # ── embed ─────────────────────────────────────────────────────────────────
     def embed(self, text: str, *, model: str | None = None, dimensions: int = 128) -> dict:
         payload: dict[str, Any] = {"text": text, "dimensions": dimensions}
@@ -69,28 +201,15 @@ class JumpNetClient:
         return self._json("GET", f"/dataset/{name}")
 
     def dataset_upload(self, image: bytes | Path, *, dataset: str, label: str) -> dict:
-        if isinstance(image, Path):
-            filename = image.name
-            image = image.read_bytes()
-        else:
-            filename = "image.jpg"
-        boundary = b"----JumpNetPyBoundary123"
-        CRLF = b"\r\n"
-
-        def field(name: str, value: str) -> bytes:
-            return (b"--" + boundary + CRLF +
-                    f'Content-Disposition: form-data; name="{name}"'.encode() + CRLF + CRLF +
-                    value.encode() + CRLF)
-
-        file_part = (
-            b"--" + boundary + CRLF +
-            f'Content-Disposition: form-data; name="file"; filename="{filename}"'.encode() + CRLF +
-            b"Content-Type: image/jpeg" + CRLF + CRLF +
-            image + CRLF
-        )
-        body = field("dataset", dataset) + field("label", label) + file_part + b"--" + boundary + b"--" + CRLF
+        """
+        Upload one labelled image.  A Path is streamed from disk rather than
+        read into memory.
+        """
+        filename = image.name if isinstance(image, Path) else "image.jpg"
+        body, content_type, length = build_multipart(
+            {"dataset": dataset, "label": label}, (filename, image, "image/jpeg"))
         return self._request("POST", "/dataset/upload", data=body,
-                             content_type=f"multipart/form-data; boundary={boundary.decode()}")
+                             content_type=content_type, length=length)
 
     def dataset_delete(self, dataset: str, label: str, filename: str) -> None:
         self._json("DELETE", f"/dataset/{dataset}/{label}/{filename}")
@@ -100,7 +219,7 @@ class JumpNetClient:
         if isinstance(image, Path):
             image = image.read_bytes()
         if isinstance(image, bytes):
-            image = base64.b64encode(image).decode()
+            image = _b64str(image)
         return self._json("POST", "/compose", {"image": image, "pipeline": pipeline})
 
     # ── imprint ───────────────────────────────────────────────────────────────
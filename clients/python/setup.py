@@ -0,0 +1,27 @@
+"""
+clients/python/setup.py
+
+Installs the stdlib-only JumpNet client:
+    pip install ./clients/python
+
+Set JUMPNET_ENABLE_SPEEDUPS=1 to compile jumpnet/jumpnet.py with Cython
+(declarations in jumpnet/jumpnet.pxd); requires Cython and a C compiler.
+Without it the pure-Python module is installed unchanged.
+"""
+import os
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("JUMPNET_ENABLE_SPEEDUPS") == "1":
+    from Cython.Build import cythonize
+    ext_modules = cythonize("jumpnet/jumpnet.py", language_level=3)
+
+setup(
+    name="jumpnet",
+    version="0.1.0",
+    description="Python client for the JumpNet API",
+    packages=["jumpnet"],
+    package_data={"jumpnet": ["*.pxd"]},
+    ext_modules=ext_modules,
+    python_requires=">=3.8",
+)
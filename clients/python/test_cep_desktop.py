@@ -28,6 +28,9 @@ class _I2C:
         self.bus_id = bus_id
     def scan(self):
         return [0x76, 0x3C]   # BME280 + SSD1306
+    def writeto(self, addr, buf):
+        if addr not in self.scan():
+            raise OSError(19)  # ENODEV — no ACK
 
 class _ADC:
     def __init__(self, pin): pass
@@ -84,6 +87,22 @@ sys.modules["neopixel"] = neopixel
 urequests = types.ModuleType("urequests")
 sys.modules["urequests"] = urequests
 
+# ----- usocket (records what register_with_jumpnet streams) ------------------
+usocket = types.ModuleType("usocket")
+_sent = []
+class _Socket:
+    def connect(self, addr): self.addr = addr
+    def sendall(self, data): _sent.append(bytes(data))
+    def recv(self, n): return b"HTTP/1.1 201 Created\r\n\r\n"
+    def close(self): pass
+usocket.socket      = _Socket
+usocket.getaddrinfo = lambda host, port: [(2, 1, 0, "", (host, port))]
+sys.modules["usocket"] = usocket
+
+# ----- cbor2 / cbor (blocked so registration takes the ujson path) -----------
+sys.modules["cbor2"] = None
+sys.modules["cbor"]  = None
+
 # ── 2. Point the import path at the MicroPython client directory ──────────────
 
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[2]
@@ -137,10 +156,10 @@ if i2c_cap:
     check("I2C found 0x76 (BME280)",   "0x76" in found, str(found))
     check("I2C found 0x3c (SSD1306)",  "0x3c" in found, str(found))
 
-# Sensor caps from chipset plugins
+# Sensor caps from the chipset registry
 sensors = [c for c in caps if c["type"] == "sensor"]
 sensor_names = [s["chipset"] for s in sensors]
-check("BME280 plugin detected",   "bme280" in sensor_names, str(sensor_names))
+check("BME280 chipset detected",   "bme280" in sensor_names, str(sensor_names))
 
 display_caps = [c for c in caps if c["type"] == "display"]
 check("SSD1306 display detected", any(d.get("chipset") == "ssd1306" for d in display_caps),
@@ -158,6 +177,90 @@ if net:
     check("WiFi SSID present",    bool(iface.get("ssid")), str(iface))
     check("IP present",           bool(iface.get("ip")),   str(iface))
 
+# ADC — static table by default, runtime probe only for explicit pins
+check("no ADC guess on unknown port", cep_module.detect_adc() is None)
+check("explicit ADC pins are probed", (cep_module.detect_adc([32, 33]) or {}).get("pins") == [32, 33])
+
+# NeoPixel — never probed unless asked
+check("no NeoPixel guess on unknown board", cep_module.detect_neopixel([5]) is None)
+check("aggressive probe finds NeoPixel",
+      (cep_module.detect_neopixel([5], aggressive=True) or {}).get("pin") == 5)
+
+# I2C bus objects are reused across scans
+bus = cep_module._get_i2c(0, 21, 22)
+cep_module.scan_i2c([(0, 21, 22)])
+check("I2C instance reused", cep_module._get_i2c(0, 21, 22) is bus)
+cep_module.close()
+check("close() empties the I2C cache", cep_module._I2C_CACHE == {})
+check("I2C reopened after close()",    cep_module._get_i2c(0, 21, 22) is not bus)
+
+# Caching
+again = cep_module.getCapabilitiesJSON(i2c_buses=[(0, 21, 22)], neopixel_candidates=[5])
+check("same hints return cached doc", again is doc)
+fresh = cep_module.getCapabilitiesJSON(i2c_buses=[(0, 21, 22)], neopixel_candidates=[5],
+                                       force_refresh=True)
+check("force_refresh rebuilds doc",   fresh is not doc and fresh["capabilities"] == caps)
+
+# Empty fields are dropped from the wire format
+check("_compact drops empty fields",
+      cep_module._compact({"a": "", "b": None, "c": [], "d": {"e": {}}, "f": 0, "g": [{"h": ""}]})
+      == {"d": {}, "f": 0, "g": [{}]})
+
+# Registration (chunked stream of static fragments + dynamic tail)
+def _dechunk(raw):
+    head, _, rest = raw.partition(b"\r\n\r\n")
+    body = b""
+    while True:
+        size_line, _, rest = rest.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            return head, body
+        body, rest = body + rest[:size], rest[size + 2:]
+
+check("register_with_jumpnet ok", cep_module.register_with_jumpnet("http://host:4080/") is True)
+head, raw_body = _dechunk(b"".join(_sent))
+check("request is chunked POST /devices/register",
+      head.startswith(b"POST /devices/register ") and b"Transfer-Encoding: chunked" in head,
+      head.decode())
+check("Host header keeps the port", b"\r\nHost: host:4080\r\n" in head, head.decode())
+try:
+    posted = json.loads(raw_body)
+except Exception as e:
+    posted = {}
+    check("registration body is valid JSON", False, str(e))
+check("registration body keeps device.id", posted.get("device", {}).get("id") == fresh["device"]["id"])
+check("registration body has reportedAt",  bool(posted.get("device", {}).get("reportedAt")))
+check("registration body keeps capabilities",
+      [c["type"] for c in posted.get("capabilities", [])] == [c["type"] for c in fresh["capabilities"]])
+
+# Short-key dialect, used only when the server advertises it
+_ALIASES = {"d": "device", "c": "capabilities", "t": "type", "cs": "chipset",
+            "b": "bus_id", "a": "address", "p": "provides"}
+class _SchemaResp:
+    status_code = 200
+    def json(self): return {"aliases": _ALIASES}
+    def close(self): pass
+def _schema_down(url):
+    raise OSError(113)   # EHOSTUNREACH — Wi-Fi not up yet
+urequests.get = _schema_down
+check("schema fetch error is not cached",
+      cep_module._server_aliases("http://short:4080") is None
+      and "http://short:4080" not in cep_module._ALIAS_CACHE)
+urequests.get = lambda url: _SchemaResp()
+_sent.clear()
+cep_module.register_with_jumpnet("http://short:4080")
+_, raw_body = _dechunk(b"".join(_sent))
+short = json.loads(raw_body)
+def _expand(o):
+    if isinstance(o, dict):
+        return {_ALIASES.get(k, k): _expand(v) for k, v in o.items()}
+    return [_expand(x) for x in o] if isinstance(o, list) else o
+check("compact body uses short keys", set(short) == {"d", "c"}, str(list(short)))
+expanded = _expand(short)
+expanded["device"].pop("reportedAt", None)
+posted["device"].pop("reportedAt", None)
+check("compact body expands to full doc", expanded == posted)
+
 # JSON serialisability
 try:
     serialised = json.dumps(doc, indent=2)
@@ -14,6 +14,9 @@ Environment variables:
     LABEL         default test-label
 """
 import sys, os, json, base64, urllib.request, urllib.error
+from pathlib import Path
+
+from jumpnet import build_multipart
 
 JUMPNET = os.environ.get("JUMPNET_URL", "http://localhost:4080").rstrip("/")
 DATASET = os.environ.get("DATASET", "test-dataset")
@@ -40,32 +43,14 @@ def upload_base64():
 
 
 def upload_file(path: str):
-    filename = os.path.basename(path)
-    with open(path, "rb") as f:
-        img_data = f.read()
-
-    boundary = b"----JumpNetPyTestBoundary"
-    CRLF = b"\r\n"
-
-    def field(name: str, value: str) -> bytes:
-        return (
-            b"--" + boundary + CRLF
-            + f'Content-Disposition: form-data; name="{name}"'.encode() + CRLF + CRLF
-            + value.encode() + CRLF
-        )
-
-    file_part = (
-        b"--" + boundary + CRLF
-        + f'Content-Disposition: form-data; name="file"; filename="{filename}"'.encode() + CRLF
-        + b"Content-Type: image/jpeg" + CRLF + CRLF
-        + img_data + CRLF
+    body, content_type, length = build_multipart(
+        {"dataset": DATASET, "label": LABEL},
+        (os.path.basename(path), Path(path), "image/jpeg"),
     )
-    body = field("dataset", DATASET) + field("label", LABEL) + file_part + b"--" + boundary + b"--" + CRLF
-
     req = urllib.request.Request(
         f"{JUMPNET}/dataset/upload",
-        data=body,
-        headers={"Content-Type": f"multipart/form-data; boundary={boundary.decode()}"},
+        data=body(),                     # streamed from disk
+        headers={"Content-Type": content_type, "Content-Length": str(length)},
         method="POST",
     )
     return req
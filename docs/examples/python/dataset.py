@@ -1,38 +1,24 @@
 """
 examples/python/dataset.py — upload an image to a JumpNet dataset.
 Usage:  python dataset.py <image_path> <dataset_name> <label>
+Needs the Python client installed:  pip install ./clients/python
 """
 import sys, urllib.request
+from pathlib import Path
+
+from jumpnet import build_multipart
 
 JUMPNET = "http://localhost:4080"
 
 def upload(image_path: str, dataset: str, label: str) -> str:
-    boundary = b"----JumpNetPyBoundary"
-    CRLF = b"\r\n"
-
-    def field(name: str, value: str) -> bytes:
-        return (
-            b"--" + boundary + CRLF +
-            f'Content-Disposition: form-data; name="{name}"'.encode() + CRLF + CRLF +
-            value.encode() + CRLF
-        )
-
-    with open(image_path, "rb") as f:
-        img_data = f.read()
-
-    filename = image_path.split("/")[-1].split("\\")[-1]
-    file_part = (
-        b"--" + boundary + CRLF +
-        f'Content-Disposition: form-data; name="file"; filename="{filename}"'.encode() + CRLF +
-        b"Content-Type: image/jpeg" + CRLF + CRLF +
-        img_data + CRLF
-    )
-    body = field("dataset", dataset) + field("label", label) + file_part + b"--" + boundary + b"--" + CRLF
+    path = Path(image_path)
+    body, content_type, length = build_multipart(
+        {"dataset": dataset, "label": label}, (path.name, path, "image/jpeg"))
 
     req = urllib.request.Request(
         f"{JUMPNET}/dataset/upload",
-        data=body,
-        headers={"Content-Type": f"multipart/form-data; boundary={boundary.decode()}"},
+        data=body(),                     # streamed from disk
+        headers={"Content-Type": content_type, "Content-Length": str(length)},
         method="POST",
     )
     with urllib.request.urlopen(req) as resp:
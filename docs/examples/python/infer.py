@@ -4,11 +4,17 @@ Usage:  python infer.py <image_path> [bundle_id]
 """
 import sys, base64, json, urllib.request
 
+try:
+    from pybase64 import b64encode_as_string as _b64str   # SIMD, optional
+except ImportError:
+    def _b64str(data: bytes) -> str:
+        return base64.b64encode(data).decode()
+
 JUMPNET = "http://localhost:4080"
 
 def infer(image_path: str, bundle_id: str | None = None) -> dict:
     with open(image_path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode()
+        b64 = _b64str(f.read())
 
     payload = {"image": b64}
     if bundle_id:
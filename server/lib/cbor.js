@@ -0,0 +1,141 @@
+/**
+ * server/lib/cbor.js
+ *
+ * Minimal CBOR (RFC 8949) decoder for CEP documents posted by MicroPython
+ * devices with `Content-Type: application/cbor`.
+ *
+ * Covers everything a cbor2 / micropython-lib encoder emits for a JSON-shaped
+ * document: integers (up to ±2^53, beyond which Numbers lose precision and
+ * BigInts cannot be JSON-serialised), byte and text strings (definite and indefinite length),
+ * arrays, maps, tags (value passed through), booleans, null and floats.
+ * Kept dependency-free so the server still only needs express + multer.
+ */
+
+const _textDecoder = new TextDecoder();
+
+/**
+ * Decode a single CBOR data item.
+ *
+ * @param {Buffer|Uint8Array} buf
+ * @returns {any}
+ * @throws {Error} on truncated or malformed input
+ */
+export function decodeCbor(buf) {
+  const view = new DataView(buf.buffer, buf.byteOffset, buf.byteLength);
+  let pos = 0;
+
+  const need = n => {
+    if (pos + n > buf.length) throw new Error('CBOR: unexpected end of input');
+  };
+
+  const readLength = info => {
+    if (info < 24) return info;
+    if (info === 24) { need(1); return view.getUint8(pos++); }
+    if (info === 25) { need(2); const v = view.getUint16(pos); pos += 2; return v; }
+    if (info === 26) { need(4); const v = view.getUint32(pos); pos += 4; return v; }
+    if (info === 27) {
+      need(8);
+      const v = view.getBigUint64(pos); pos += 8;
+      // A BigInt would make the stored document unserialisable by res.json()
+      if (v > BigInt(Number.MAX_SAFE_INTEGER)) throw new Error('CBOR: integer exceeds 2^53 - 1');
+      return Number(v);
+    }
+    if (info === 31) return -1;                            // indefinite length
+    throw new Error(`CBOR: invalid additional info ${info}`);
+  };
+
+  const readChunks = major => {
+    const parts = [];
+    for (;;) {
+      need(1);
+      if (buf[pos] === 0xff) { pos++; break; }
+      const initial = buf[pos++];
+      if (initial >> 5 !== major) throw new Error('CBOR: bad chunk in indefinite string');
+      const len = readLength(initial & 0x1f);
+      if (len === -1) throw new Error('CBOR: nested indefinite chunk in indefinite string');
+      need(len);
+      parts.push(buf.subarray(pos, pos + len));
+      pos += len;
+    }
+    return Buffer.concat(parts);
+  };
+
+  // Own data property even for a "__proto__" key, matching JSON.parse
+  const setKey = (obj, k, v) => {
+    Object.defineProperty(obj, k, { value: v, writable: true, enumerable: true, configurable: true });
+  };
+
+  const readItem = () => {
+    need(1);
+    const initial = buf[pos++];
+    const major   = initial >> 5;
+    const info    = initial & 0x1f;
+
+    if (major === 7) {
+      switch (info) {
+        case 20: return false;
+        case 21: return true;
+        case 22: return null;
+        case 23: return undefined;
+        case 25: {
+          need(2);
+          const h = view.getUint16(pos); pos += 2;
+          const exp = (h >> 10) & 0x1f, mant = h & 0x3ff;
+          const sign = h & 0x8000 ? -1 : 1;
+          if (exp === 0)  return sign * 2 ** -14 * (mant / 1024);
+          if (exp === 31) return mant ? NaN : sign * Infinity;
+          return sign * 2 ** (exp - 15) * (1 + mant / 1024);
+        }
+        case 26: { need(4); const v = view.getFloat32(pos); pos += 4; return v; }
+        case 27: { need(8); const v = view.getFloat64(pos); pos += 8; return v; }
+        default:
+          if (info < 24) return undefined;                 // unassigned simple value
+          throw new Error(`CBOR: unsupported simple value ${info}`);
+      }
+    }
+
+    const len = readLength(info);
+    if (len === -1 && (major < 2 || major > 5)) {
+      throw new Error(`CBOR: indefinite length not allowed for major type ${major}`);
+    }
+
+    switch (major) {
+      case 0: return len;
+      case 1: return -1 - len;
+      case 2:
+        if (len === -1) return readChunks(2);
+        need(len);
+        return Buffer.from(buf.subarray(pos, pos += len));
+      case 3:
+        if (len === -1) return _textDecoder.decode(readChunks(3));
+        need(len);
+        return _textDecoder.decode(buf.subarray(pos, pos += len));
+      case 4: {
+        const arr = [];
+        if (len === -1) {
+          while ((need(1), buf[pos]) !== 0xff) arr.push(readItem());
+          pos++;
+        } else {
+          for (let i = 0; i < len; i++) arr.push(readItem());
+        }
+        return arr;
+      }
+      case 5: {
+        const obj = {};
+        if (len === -1) {
+          while ((need(1), buf[pos]) !== 0xff) { const k = readItem(); setKey(obj, k, readItem()); }
+          pos++;
+        } else {
+          for (let i = 0; i < len; i++) { const k = readItem(); setKey(obj, k, readItem()); }
+        }
+        return obj;
+      }
+      case 6: return readItem();                           // tag — keep the tagged value
+    }
+    throw new Error(`CBOR: unsupported major type ${major}`);
+  };
+
+  const value = readItem();
+  if (pos !== buf.length) throw new Error('CBOR: trailing bytes after data item');
+  return value;
+}
@@ -16,6 +16,55 @@
  * @property {string}   _ip           — originating IP if available
  */
 
+// ── Wire-format key aliases ───────────────────────────────────────────────────
+
+/**
+ * Short field names a device may send instead of the full CEP keys
+ * (short → full).  Advertised at GET /devices/schema so clients only use
+ * them against servers that understand them.
+ */
+export const CEP_KEY_ALIASES = Object.freeze({
+  d:  'device',
+  c:  'capabilities',
+  t:  'type',
+  cs: 'chipset',
+  b:  'bus_id',
+  a:  'address',
+  p:  'provides',
+});
+
+/**
+ * True if a posted document uses the short-key dialect.
+ *
+ * @param {object} doc
+ * @returns {boolean}
+ */
+export function isShortKeyed(doc) {
+  return doc != null && typeof doc === 'object' && 'd' in doc && !('device' in doc);
+}
+
+/**
+ * Recursively rewrite short keys back to their full CEP names.
+ *
+ * @param {any} value
+ * @returns {any}
+ */
+export function expandKeys(value) {
+  if (Array.isArray(value)) return value.map(expandKeys);
+  if (value === null || typeof value !== 'object' || Buffer.isBuffer(value)) return value;
+  const out = {};
+  for (const [k, v] of Object.entries(value)) {
+    // defineProperty so a "__proto__" key stays an own property, as in JSON.parse
+    const key = Object.hasOwn(CEP_KEY_ALIASES, k) ? CEP_KEY_ALIASES[k] : k;
+    Object.defineProperty(out, key, {
+      value: expandKeys(v), writable: true, enumerable: true, configurable: true,
+    });
+  }
+  return out;
+}
+
+// ── Storage ───────────────────────────────────────────────────────────────────
+
 /** @type {Map<string, CepDevice>} keyed by device.id */
 const _registry = new Map();
 
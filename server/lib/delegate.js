@@ -23,11 +23,14 @@ const TIMEOUT_MS   = 5_000;
  * Attempt to delegate a route to a GPU helper node.
  *
  * @param {string} route    e.g. '/train'  or  '/infer'
- * @param {object} body     original request body (may be undefined for GET)
+ * @param {object} body     original request body (may be undefined for GET);
+ *                          with a fileBuffer, its string fields (e.g.
+ *                          bundleId) are sent as multipart fields
  * @param {Buffer|null} [fileBuffer]  raw upload buffer for multipart routes
+ * @param {string} [fileType]         Content-Type of fileBuffer
  * @returns {Promise<object|null>}   parsed JSON from helper, or null to run locally
  */
-export async function tryDelegate(route, body, fileBuffer = null) {
+export async function tryDelegate(route, body, fileBuffer = null, fileType = 'image/jpeg') {
   if (!HELPER_URL) return null;
 
   try {
@@ -47,10 +50,17 @@ export async function tryDelegate(route, body, fileBuffer = null) {
       // Multipart — rebuild simple multipart body
       const boundary = `----JumpNetDelegate${Date.now()}`;
       const CRLF     = '\r\n';
+      const bFields  = Object.entries(body ?? {})
+        .filter(([, v]) => typeof v === 'string')
+        .map(([k, v]) =>
+          `--${boundary}${CRLF}` +
+          `Content-Disposition: form-data; name="${k}"${CRLF}${CRLF}${v}${CRLF}`)
+        .join('');
       const bHead    = Buffer.from(
+        bFields +
         `--${boundary}${CRLF}` +
         `Content-Disposition: form-data; name="image"; filename="image.jpg"${CRLF}` +
-        `Content-Type: image/jpeg${CRLF}${CRLF}`
+        `Content-Type: ${fileType}${CRLF}${CRLF}`
       );
       const bTail    = Buffer.from(`${CRLF}--${boundary}--${CRLF}`);
       const payload  = Buffer.concat([bHead, fileBuffer, bTail]);
@@ -13,15 +13,29 @@ Usage:
     echo '{"datasetPath":"/path/to/dataset","labels":["a","b"],"epochs":5,"modelDir":"/path/to/models/current"}' | python train.py
 """
 
-import sys, json, os, io, time
+import sys, json, os, io, time, copy
+
+try:
+    import orjson   # optional; several times faster for the stdout JSON lines
+    _dumps, _loads = orjson.dumps, orjson.loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+def emit(obj: dict):
+    """Write one JSON line to stdout (read line-by-line by mlRunner.js)."""
+    sys.stdout.buffer.write(_dumps(obj) + b"\n")
+    sys.stdout.buffer.flush()
 
 def fail(msg: str):
-    print(json.dumps({"status": "error", "message": msg}), flush=True)
+    emit({"status": "error", "message": msg})
     sys.exit(1)
 
 # ── Read config from stdin ─────────────────────────────────────────────────────
 try:
-    config = json.loads(sys.stdin.read())
+    config = _loads(sys.stdin.buffer.read())
 except Exception as e:
     fail(f"Invalid JSON input: {e}")
 
@@ -31,6 +45,7 @@ epochs       = int(config.get("epochs", 5))
 model_dir    = config.get("modelDir", "")
 img_size     = int(config.get("imageSize", 224))
 batch_size   = int(config.get("batchSize", 16))
+seed         = int(config.get("seed", 0))
 
 if not dataset_path or not os.path.isdir(dataset_path):
     fail(f"datasetPath not found: {dataset_path}")
@@ -45,25 +60,36 @@ try:
     import torch.optim as optim
     from torchvision import datasets, transforms, models
     from torch.utils.data import DataLoader, Subset
-    import random
+    import multiprocessing as mp
 except ImportError as e:
     fail(f"Missing dependency: {e}. Install with: pip install torch torchvision")
 
 # ── Device ────────────────────────────────────────────────────────────────────
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-print(json.dumps({"status": "progress", "message": f"Using device: {device}"}), flush=True)
+emit({"status": "progress", "message": f"Using device: {device}"})
 
 # ── Dataset ───────────────────────────────────────────────────────────────────
-transform = transforms.Compose([
-    transforms.Resize((img_size, img_size)),
-    transforms.RandomHorizontalFlip(),
-    transforms.ColorJitter(brightness=0.2, contrast=0.2),
-    transforms.ToTensor(),
-    transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225]),
-])
+# Loader yields uint8 NCHW batches; ToTensor + Normalize are folded into one
+# in-place subtract/multiply on the device (see normalize), which also cuts
+# host-to-device traffic to a quarter.
+def make_transform(img_size: int, train: bool):
+    """PIL image → uint8 CHW tensor; random augmentation on the training split only."""
+    ops = [transforms.Resize((img_size, img_size))]
+    if train:
+        ops += [transforms.RandomHorizontalFlip(),
+                transforms.ColorJitter(brightness=0.2, contrast=0.2)]
+    ops.append(transforms.PILToTensor())
+    return transforms.Compose(ops)
+
+_MEAN    = torch.tensor([0.485, 0.456, 0.406], device=device).mul(255).view(1, 3, 1, 1)
+_INV_STD = torch.tensor([0.229, 0.224, 0.225], device=device).mul(255).reciprocal().view(1, 3, 1, 1)
+
+def normalize(imgs):
+    """uint8 batch → normalised float32 batch on device."""
+    return imgs.to(device, non_blocking=True).float().sub_(_MEAN).mul_(_INV_STD)
 
 try:
-    full_dataset = datasets.ImageFolder(dataset_path, transform=transform)
+    full_dataset = datasets.ImageFolder(dataset_path, transform=make_transform(img_size, train=True))
 except Exception as e:
     fail(f"Failed to load dataset from {dataset_path}: {e}")
 
@@ -75,16 +101,30 @@ if not labels:
     labels = full_dataset.classes
 
 num_classes = len(full_dataset.classes)
-print(json.dumps({"status": "progress", "message": f"Classes: {full_dataset.classes}, images: {len(full_dataset)}"}), flush=True)
-
-# Train/val split (80/20)
-indices = list(range(len(full_dataset)))
-random.shuffle(indices)
-split   = max(1, int(0.8 * len(indices)))
-train_idx, val_idx = indices[:split], indices[split:]
-
-train_loader = DataLoader(Subset(full_dataset, train_idx), batch_size=batch_size, shuffle=True,  num_workers=0)
-val_loader   = DataLoader(Subset(full_dataset, val_idx),   batch_size=batch_size, shuffle=False, num_workers=0)
+emit({"status": "progress", "message": f"Classes: {full_dataset.classes}, images: {len(full_dataset)}"})
+
+# Train/val split (80/20), seeded so a run's split is reproducible
+perm  = torch.randperm(len(full_dataset), generator=torch.Generator().manual_seed(seed)).tolist()
+split = max(1, int(0.8 * len(perm)))
+train_idx, val_idx = perm[:split], perm[split:]
+
+# Decode/augment in worker processes so the device isn't waiting on PIL.
+# Workers are forked explicitly: Python 3.14 made forkserver the Linux
+# default, and with spawn/forkserver each worker would re-run this
+# top-level script.  Where fork is unavailable (Windows) or unsafe (macOS)
+# training stays single-process.
+can_fork    = sys.platform != "darwin" and "fork" in mp.get_all_start_methods()
+num_workers = min(8, os.cpu_count() or 2) if can_fork else 0
+loader_opts = {"batch_size": batch_size, "num_workers": num_workers, "pin_memory": device.type == "cuda"}
+if num_workers:
+    loader_opts.update(multiprocessing_context="fork", persistent_workers=True, prefetch_factor=4)
+
+# Validation shares the scanned file list but skips the random augmentation
+val_dataset = copy.copy(full_dataset)
+val_dataset.transform = make_transform(img_size, train=False)
+
+train_loader = DataLoader(Subset(full_dataset, train_idx), shuffle=True,  **loader_opts)
+val_loader   = DataLoader(Subset(val_dataset,  val_idx),   shuffle=False, **loader_opts)
 
 # ── Model ─────────────────────────────────────────────────────────────────────
 model = models.mobilenet_v2(weights=models.MobileNet_V2_Weights.DEFAULT)
@@ -97,47 +137,60 @@ criterion = nn.CrossEntropyLoss()
 optimizer = optim.Adam(model.parameters(), lr=1e-4)
 scheduler = optim.lr_scheduler.StepLR(optimizer, step_size=max(1, epochs // 2), gamma=0.5)
 
+# Mixed precision on CUDA (FP16 forward + loss-scaled backward); CPU stays FP32.
+use_amp = device.type == "cuda"
+scaler  = torch.amp.GradScaler("cuda", enabled=use_amp)
+
 # ── Training loop ─────────────────────────────────────────────────────────────
 best_acc   = 0.0
-best_state = None
+# Snapshot buffers allocated once and overwritten in place on each improvement
+best_state = {k: torch.empty_like(v) for k, v in model.state_dict().items()}
+have_best  = False
 
 for epoch in range(1, epochs + 1):
     # Train
     model.train()
     train_loss = 0.0
     for imgs, lbls in train_loader:
-        imgs, lbls = imgs.to(device), lbls.to(device)
+        imgs, lbls = normalize(imgs), lbls.to(device, non_blocking=True)
         optimizer.zero_grad()
-        loss = criterion(model(imgs), lbls)
-        loss.backward()
-        optimizer.step()
+        with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+            loss = criterion(model(imgs), lbls)
+        scaler.scale(loss).backward()
+        scaler.step(optimizer)
+        scaler.update()
         train_loss += loss.item()
 
     # Validate
     model.eval()
-    correct = total = 0
+    # Counted on device; one sync per epoch instead of one .item() per batch
+    correct = torch.zeros((), dtype=torch.long, device=device)
+    total   = 0
     with torch.no_grad():
         for imgs, lbls in val_loader:
-            imgs, lbls = imgs.to(device), lbls.to(device)
-            preds = model(imgs).argmax(dim=1)
-            correct += (preds == lbls).sum().item()
+            imgs, lbls = normalize(imgs), lbls.to(device, non_blocking=True)
+            with torch.autocast(device_type=device.type, dtype=torch.float16, enabled=use_amp):
+                preds = model(imgs).argmax(dim=1)
+            correct += (preds == lbls).sum()
             total   += lbls.size(0)
 
-    acc = correct / total if total > 0 else 0.0
+    acc = correct.item() / total if total > 0 else 0.0
     if acc > best_acc:
         best_acc   = acc
-        best_state = {k: v.clone() for k, v in model.state_dict().items()}
+        have_best  = True
+        for k, v in model.state_dict().items():
+            best_state[k].copy_(v, non_blocking=True)
 
     scheduler.step()
-    print(json.dumps({"status": "progress", "epoch": epoch, "epochs": epochs,
-                      "trainLoss": round(train_loss / max(1, len(train_loader)), 4),
-                      "valAccuracy": round(acc, 4)}), flush=True)
+    emit({"status": "progress", "epoch": epoch, "epochs": epochs,
+          "trainLoss": round(train_loss / max(1, len(train_loader)), 4),
+          "valAccuracy": round(acc, 4)})
 
 # ── Save ──────────────────────────────────────────────────────────────────────
 model_path    = os.path.join(model_dir, "model.pth")
 metadata_path = os.path.join(model_dir, "metadata.json")
 
-if best_state:
+if have_best:
     model.load_state_dict(best_state)
 torch.save(model.state_dict(), model_path)
 
@@ -155,10 +208,10 @@ metadata = {
 with open(metadata_path, "w") as f:
     json.dump(metadata, f, indent=2)
 
-print(json.dumps({
+emit({
     "status":    "ok",
     "epochs":    epochs,
     "accuracy":  round(best_acc, 4),
     "modelPath": model_dir,
     "labels":    labels,
-}), flush=True)
+})
@@ -3,6 +3,7 @@
  *
  * Spawns Python ML subprocesses (train.py / infer.py) and communicates
  * via stdin/stdout JSON. Streams progress lines back as they arrive.
+ * infer.py runs as a long-lived worker (see runInfer).
  *
  * Usage:
  *   const { runTrain, runInfer } = await import('./mlRunner.js');
@@ -86,4 +87,95 @@ export const runTrain = (input, onProgress) => runPython('train.py', input, onPr
 //                               on Snapdragon devices, CPU fallback everywhere else
 const INFER_SCRIPT = process.env.INFER_BACKEND === 'onnx' ? 'infer_onnx.py' : 'infer.py';
 
-export const runInfer = (input, onProgress) => runPython(INFER_SCRIPT, input, onProgress);
+// ── Persistent inference worker ──────────────────────────────────────────────
+// infer.py --serve keeps torch imported and models loaded between requests,
+// so only the first call pays the start-up cost.  Requests are written as
+// newline-delimited JSON and answered in order, one result line each.
+// A request at the head of the queue that takes longer than
+// INFER_TIMEOUT_MS kills the worker and fails everything queued behind it,
+// so one wedged request can't hang every later caller.
+
+const INFER_TIMEOUT_MS = Number(process.env.INFER_TIMEOUT_MS) || 60_000;
+
+let inferWorker = null;
+
+function startInferWorker() {
+  const child   = spawn(PYTHON, [join(ML_DIR, INFER_SCRIPT), '--serve'], { stdio: ['pipe', 'pipe', 'pipe'] });
+  const pending = [];                                  // FIFO of { resolve, reject }
+  const stderr  = [];
+  let   timer   = null;
+
+  const retire = err => {
+    clearTimeout(timer);
+    if (inferWorker === worker) inferWorker = null;
+    for (const request of pending.splice(0)) request.reject(err);
+  };
+
+  // (Re)start the clock for whichever request is now at the head of the queue
+  const armTimer = () => {
+    clearTimeout(timer);
+    timer = pending.length ? setTimeout(() => {
+      retire(new Error(`Inference timed out after ${INFER_TIMEOUT_MS} ms`));
+      child.kill('SIGKILL');
+    }, INFER_TIMEOUT_MS) : null;
+  };
+
+  const worker = {
+    child,
+    send(input) {
+      return new Promise((resolve, reject) => {
+        if (pending.push({ resolve, reject }) === 1) armTimer();
+        child.stdin.write(JSON.stringify(input) + '\n');
+      });
+    },
+  };
+
+  createInterface({ input: child.stdout }).on('line', line => {
+    if (!line.trim()) return;
+    let parsed;
+    try { parsed = JSON.parse(line); } catch { return; }      // ignore non-JSON stdout noise
+    if (parsed.status === 'progress') return;
+
+    stderr.length = 0;                                 // start-up warnings aren't a crash message
+    const request = pending.shift();
+    armTimer();
+    if (!request) return;
+    if (parsed.status === 'ok') request.resolve(parsed);
+    else request.reject(new Error(parsed.message ?? 'ML script error'));
+  });
+
+  child.stderr.on('data', d => {
+    stderr.push(d.toString());
+    if (stderr.length > 50) stderr.shift();
+  });
+
+  child.stdin.on('error', () => {});                   // surfaced via 'close' below
+  child.on('close', code => retire(new Error(stderr.join('') || `Inference worker exited with code ${code}`)));
+  child.on('error', err => retire(err.code === 'ENOENT'
+    ? new Error(`Python not found (tried: "${PYTHON}"). Set PYTHON_BIN env var.`)
+    : err));
+
+  return worker;
+}
+
+/**
+ * Run one inference.  infer.py requests go to the persistent worker (started
+ * on first use, restarted if it exits or times out); other backends run
+ * one-shot.
+ *
+ * @param {object}   input        { imagePath | imageBase64, modelDir }
+ * @param {Function} [onProgress]
+ * @returns {Promise<object>}     { status: 'ok', prediction, scores }
+ */
+export function runInfer(input, onProgress) {
+  if (INFER_SCRIPT !== 'infer.py') return runPython(INFER_SCRIPT, input, onProgress);
+
+  inferWorker ??= startInferWorker();
+  return inferWorker.send(input);
+}
+
+/** Stop the persistent inference worker, if running. */
+export function stopInferWorker() {
+  inferWorker?.child.stdin.end();
+  inferWorker = null;
+}
@@ -3,7 +3,8 @@
  *
  * REST API for CEP device registration and discovery.
  *
- * POST  /devices/register         — device submits its CEP document
+ * POST  /devices/register         — device submits its CEP document (JSON or CBOR)
+ * GET   /devices/schema           — short-key aliases accepted by /register
  * GET   /devices                  — list all registered devices
  * GET   /devices/:id              — get full CEP document for one device
  * DELETE /devices/:id             — remove a device
@@ -11,7 +12,8 @@
  * GET   /devices/query/provides/:measure   — filter by sensor measurement
  */
 
-import { Router }         from 'express';
+import express, { Router } from 'express';
+import { decodeCbor }     from '../lib/cbor.js';
 import {
   registerDevice,
   listDevices,
@@ -19,15 +21,37 @@ import {
   removeDevice,
   findByProvides,
   summary,
+  CEP_KEY_ALIASES,
+  isShortKeyed,
+  expandKeys,
 } from '../lib/cepRegistry.js';
 
 const router = Router();
 
 // ── POST /devices/register ───────────────────────────────────────────────────
 
-router.post('/register', (req, res, next) => {
+/**
+ * Register a device's CEP document.
+ *
+ * Accepts either content type:
+ *   application/json  — parsed by the global express.json() middleware
+ *   application/cbor  — binary CBOR body (MicroPython shim when cbor2 is
+ *                       installed); decoded here into the same object shape
+ *
+ * Either may use the short-key dialect advertised at GET /devices/schema;
+ * such documents are expanded to full CEP keys before validation.
+ */
+router.post('/register', express.raw({ type: 'application/cbor', limit: '1mb' }), (req, res, next) => {
   try {
-    const doc = req.body;
+    let doc = req.body;
+    if (Buffer.isBuffer(doc)) {
+      try {
+        doc = decodeCbor(doc);
+      } catch (err) {
+        return res.status(400).json({ error: `Invalid CBOR body: ${err.message}` });
+      }
+    }
+    if (isShortKeyed(doc)) doc = expandKeys(doc);
 
     if (!doc?.device?.id) {
       return res.status(400).json({ error: 'CEP document must include device.id' });
@@ -52,6 +76,12 @@ router.post('/register', (req, res, next) => {
   }
 });
 
+// ── GET /devices/schema ──────────────────────────────────────────────────────
+
+router.get('/schema', (_req, res) => {
+  res.json({ aliases: CEP_KEY_ALIASES });
+});
+
 // ── GET /devices ─────────────────────────────────────────────────────────────
 
 router.get('/', (_req, res) => {
@@ -4,16 +4,20 @@
  * POST /infer
  *
  * Accepts:
+ *   - raw body  Content-Type image/* or application/octet-stream (the image
+ *               bytes as-is); bundle via X-Bundle-Id header or ?bundleId=
  *   - multipart/form-data  with field "image" (image file) + optional "bundleId"
  *   - JSON { image: "<base64>", bundleId?: string }
  *   - JSON { imageId: "<dataset>/<label>/<filename>", bundleId?: string }
  *
- * Converts the image to base64 and proxies to JumpSmartsRuntime (port 7312).
+ * Proxies to JumpSmartsRuntime (port 7312).  Images that arrive as bytes
+ * (raw, multipart, imageId) are forwarded as a multipart file, so they are
+ * never base64-encoded; base64 JSON is passed through unchanged.
  *
  * Optional: if GPU_HELPER_URL is set and that node advertises a GPU,
  * the request is delegated there first.
  */
-import { Router }   from 'express';
+import express, { Router } from 'express';
 import multer       from 'multer';
 import { readFile } from 'node:fs/promises';
 import { UPSTREAM } from '../server.js';
@@ -22,45 +26,67 @@ import { tryDelegate }  from '../lib/delegate.js';
 
 const router = Router();
 const upload = multer({ storage: multer.memoryStorage(), limits: { fileSize: 20 * 1024 * 1024 } });
+const rawImage = express.raw({ type: ['image/*', 'application/octet-stream'], limit: '20mb' });
 
-router.post('/', upload.single('image'), async (req, res, next) => {
+router.post('/', rawImage, upload.single('image'), async (req, res, next) => {
   try {
+    const rawBody  = Buffer.isBuffer(req.body) ? req.body : null;
+    const fields   = rawBody ? {} : (req.body ?? {});
+    const bundleId = req.get('X-Bundle-Id') ?? req.query.bundleId ?? fields.bundleId ?? 'current';
+    const fileType = rawBody ? req.get('Content-Type') : (req.file?.mimetype ?? 'image/jpeg');
+
     // ── Optional delegation ───────────────────────────────────────────────
     if (process.env.GPU_HELPER_URL) {
-      const delegated = await tryDelegate('/infer', req.body, req.file?.buffer ?? null);
+      const delegated = await tryDelegate('/infer', { ...fields, bundleId }, req.file?.buffer ?? rawBody, fileType);
       if (delegated !== null) return res.json(delegated);
     }
 
-    // ── Resolve image → base64 ────────────────────────────────────────────
+    // ── Resolve image → bytes, or base64 when that is what was sent ───────
+    let imageBuffer = null;
     let imageBase64 = null;
 
-    if (req.file) {
-      imageBase64 = req.file.buffer.toString('base64');
-    } else if (req.body?.imageId) {
-      const parts = req.body.imageId.split('/');
+    if (rawBody) {
+      if (!rawBody.length) return res.status(400).json({ error: 'Empty image body' });
+      imageBuffer = rawBody;
+    } else if (req.file) {
+      imageBuffer = req.file.buffer;
+    } else if (fields.imageId) {
+      const parts = fields.imageId.split('/');
       if (parts.length < 3) {
         return res.status(400).json({ error: 'imageId must be "dataset/label/filename"' });
       }
       const [dataset, label, ...rest] = parts;
       const filePath = getImagePath(dataset, label, rest.join('/'));
       if (!filePath) {
-        return res.status(404).json({ error: `Image not found: ${req.body.imageId}` });
+        return res.status(404).json({ error: `Image not found: ${fields.imageId}` });
       }
-      imageBase64 = (await readFile(filePath)).toString('base64');
-    } else if (req.body?.image) {
-      imageBase64 = req.body.image.split(',').at(-1);
+      imageBuffer = await readFile(filePath);
+    } else if (fields.image) {
+      imageBase64 = fields.image.split(',').at(-1);
     } else {
       return res.status(400).json({
-        error: 'Provide multipart "image", JSON { image: "<base64>" }, or JSON { imageId: "dataset/label/file" }',
+        error: 'Provide a raw image body, multipart "image", JSON { image: "<base64>" }, or JSON { imageId: "dataset/label/file" }',
       });
     }
 
     // ── Proxy to JumpSmartsRuntime ────────────────────────────────────────
+    let upstreamReq;
+    if (imageBuffer) {
+      const form = new FormData();
+      form.append('image', new Blob([imageBuffer], { type: fileType }), 'image.jpg');
+      form.append('bundleId', bundleId);
+      upstreamReq = { body: form };
+    } else {
+      upstreamReq = {
+        headers: { 'Content-Type': 'application/json' },
+        body:    JSON.stringify({ imageBase64, bundleId }),
+      };
+    }
+
     const r = await fetch(`${UPSTREAM}/infer`, {
-      method:  'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body:    JSON.stringify({ imageBase64, bundleId: req.body?.bundleId ?? 'current' }),
-      signal:  AbortSignal.timeout(60_000),
+      method: 'POST',
+      ...upstreamReq,
+      signal: AbortSignal.timeout(60_000),
     });
 
     let data;
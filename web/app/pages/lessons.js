@@ -1060,7 +1060,7 @@ DELETE /devices/a4:cf:12:7e:00:01
       heavy lifting. It:</p>
       <ul>
         <li>Reads the board's unique ID and chip frequency.</li>
-        <li>Scans I²C buses for connected chips and matches them against chipset plugins
+        <li>Scans I²C buses for connected chips and matches them against the chipset registry
             (BME280, MPU6050, DS3231, INA219, SSD1306…).</li>
         <li>Reads Wi-Fi interface info if available.</li>
         <li>Assembles the full CEP document and POSTs it to JumpNet.</li>
@@ -1081,20 +1081,19 @@ while not wlan.isconnected():
 result = register_with_jumpnet("http://jumpnet.local:4080")
 print(result)  # {"status": "registered", "id": "a4:cf:...", ...}</code></pre>
 
-      <p>The chipset plugins live in <code>clients/micropython/chipsets/</code>.
-      Each plugin is a tiny file that declares what I²C address(es) a chip uses and
-      what measurements it provides. For example, <code>bme280.py</code>:</p>
+      <p>Known chipsets live in a single table in <code>clients/micropython/chipsets/__init__.py</code>.
+      Each row maps an I²C address to the chip found there and
+      what measurements it provides. For example, the BME280 rows:</p>
 
-      <pre><code># clients/micropython/chipsets/bme280.py
-CHIPSET = {
-    "name":          "bme280",
-    "i2c_addresses": [0x76, 0x77],
-    "bus":           "i2c",
-    "provides":      ["temperature", "humidity", "pressure"],
+      <pre><code># clients/micropython/chipsets/__init__.py
+REGISTRY = {
+    0x76: ("bme280", "sensor", ("temperature", "humidity", "pressure"), None),
+    0x77: ("bme280", "sensor", ("temperature", "humidity", "pressure"), None),
+    ...
 }</code></pre>
 
-      <p>If your sensor is not in the list, create a new file following the same pattern
-      and add its name to <code>chipsets/__init__.py</code>'s <code>PLUGIN_LIST</code>.</p>
+      <p>If your sensor is not in the list, add a row for each of its addresses
+      following the same pattern.</p>
 
       <h3>Arduino / ESP32: Using cep.h</h3>
       <p>The file <code>clients/arduino/cep.h</code> provides a C++ class that generates